@@ -1,7 +1,9 @@
 # Written by JoshuaMK 2020
 
 import atexit
+import functools
 import logging
+import mmap
 import os
 import pickle as cPickle
 import re
@@ -10,53 +12,29 @@ import signal
 import sys
 import tempfile
 from contextlib import redirect_stderr, redirect_stdout
-from distutils.version import LooseVersion
 from io import StringIO
 from pathlib import Path
 
 from PyQt5 import QtCore, QtGui, QtWidgets
 
+import tools
 from children_ui import PrefWindow, SettingsWindow
-from dolreader import DolFile
-from fileutils import get_program_folder, resource_path
-from kernel import CodeHandler, KernelLoader
+from fileutils import get_program_folder, load_resource, resource_path
 from main_ui import MainWindow
 from tools import CommandLineParser, color_text
 from versioncheck import Updater
 
-try:
-    import colorama
-    from colorama import Fore, Style
-
-    colorama.init()
-    TRESET = Style.RESET_ALL
-    TGREEN = Fore.GREEN
-    TGREENLIT = Style.BRIGHT + Fore.GREEN
-    TYELLOW = Fore.YELLOW
-    TYELLOWLIT = Style.BRIGHT + Fore.YELLOW
-    TRED = Fore.RED
-    TREDLIT = Style.BRIGHT + Fore.RED
-
-except ImportError:
-    TRESET = ""
-    TGREEN = ""
-    TGREENLIT = ""
-    TYELLOW = ""
-    TYELLOWLIT = ""
-    TRED = ""
-    TREDLIT = ""
-
 __version__ = "v7.1.1"
 
-TMPDIR = Path(tempfile.mkdtemp(prefix="GeckoLoader-"))
-
 
 @atexit.register
 def clean_tmp_resources():
-    tmpfolder = TMPDIR.parent
-    for entry in tmpfolder.iterdir():
-        if entry.name.startswith("GeckoLoader-"):
-            shutil.rmtree(entry, ignore_errors=True)
+    with os.scandir(tempfile.gettempdir()) as entries:
+        for entry in entries:
+            if entry.name.startswith("GeckoLoader-") and entry.is_dir(
+                follow_symlinks=False
+            ):
+                shutil.rmtree(entry.path, ignore_errors=True)
 
 
 class GeckoLoaderCli(CommandLineParser):
@@ -67,6 +45,14 @@ class GeckoLoaderCli(CommandLineParser):
         )
         self.__version__ = version
         self.__doc__ = description
+        self._argumentsAdded = False
+
+    def _add_arguments(self):
+        """Add the CLI arguments on first use so the splash and update paths skip them"""
+        if self._argumentsAdded:
+            return
+
+        self._argumentsAdded = True
 
         self.add_argument("dolfile", help="DOL file")
         self.add_argument("codelist", help="Folder or Gecko GCT|TXT file")
@@ -160,11 +146,20 @@ class GeckoLoaderCli(CommandLineParser):
     def __str__(self) -> str:
         return self.__doc__
 
-    def print_splash(self):
-        helpMessage = "Try option -h for more info on this program".center(64, " ")
-        version = self.__version__.rjust(9, " ")
+    def parse_known_args(self, args=None, namespace=None):
+        self._add_arguments()
+        return super().parse_known_args(args, namespace)
 
-        logo = [
+    def format_usage(self) -> str:
+        self._add_arguments()
+        return super().format_usage()
+
+    def format_help(self) -> str:
+        self._add_arguments()
+        return super().format_help()
+
+    _SPLASH_TEMPLATE = "\n".join(
+        [
             "                                                                ",
             " ╔═══════════════════════════════════════════════════════════╗  ",
             " ║                                                           ║  ",
@@ -181,26 +176,46 @@ class GeckoLoaderCli(CommandLineParser):
             " ║     ┌──┐┌┐││││ ││└──┐││┌─┐│││ │││└─┘││││││││┌┐│ ┌──┐      ║  ",
             " ║     └──┘│└┘││└─┘││└─┘│││ │││└─┘││┌─┐││││││││││└┐└──┘      ║  ",
             " ║         └──┘└───┘└───┘└┘ └┘└───┘└┘ └┘└┘└┘└┘└┘└─┘          ║  ",
-            f" ║                                                {version}  ║  ",
+            " ║                                                {version}  ║  ",
             " ╚═══════════════════════════════════════════════════════════╝  ",
             "                                                                ",
             "        GeckoLoader is a cli tool for allowing extended         ",
             "           gecko code space in all Wii and GC games.            ",
             "                                                                ",
-            f"{helpMessage}",
+            "{helpMessage}",
             "                                                                ",
         ]
+    )
 
-        for line in logo:
-            print(color_text(line, [("║", TREDLIT), ("╔╚╝╗═", TRED)], TGREENLIT))
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _render_splash(version: str) -> str:
+        logo = GeckoLoaderCli._SPLASH_TEMPLATE.format(
+            version=version.rjust(9, " "),
+            helpMessage="Try option -h for more info on this program".center(64, " "),
+        )
+
+        return "\n".join(
+            color_text(
+                line, [("║", tools.TREDLIT), ("╔╚╝╗═", tools.TRED)], tools.TGREENLIT
+            )
+            for line in logo.split("\n")
+        )
+
+    def print_splash(self):
+        print(self._render_splash(self.__version__))
 
     def check_updates(self):
+        from distutils.version import LooseVersion
+
         repoChecker = Updater("JoshuaMKW", "GeckoLoader")
 
         tag, status = repoChecker.get_newest_version()
 
         if status is False:
-            self.error(color_text(tag + "\n", defaultColor=TREDLIT), print_usage=False)
+            self.error(
+                color_text(tag + "\n", defaultColor=tools.TREDLIT), print_usage=False
+            )
 
         print("")
 
@@ -208,40 +223,40 @@ class GeckoLoaderCli(CommandLineParser):
             print(
                 color_text(
                     f"  :: A new update is live at {repoChecker.gitReleases.format(repoChecker.owner, repoChecker.repo)}",
-                    defaultColor=TYELLOWLIT,
+                    defaultColor=tools.TYELLOWLIT,
                 )
             )
             print(
                 color_text(
                     f'  :: Current version is "{self.__version__}", Most recent version is "{tag}"',
-                    defaultColor=TYELLOWLIT,
+                    defaultColor=tools.TYELLOWLIT,
                 )
             )
         elif LooseVersion(tag) < LooseVersion(self.__version__):
-            print(color_text("  :: No update available", defaultColor=TGREENLIT))
+            print(color_text("  :: No update available", defaultColor=tools.TGREENLIT))
             print(
                 color_text(
                     f'  :: Current version is "{self.__version__}(dev)", Most recent version is "{tag}(release)"',
-                    defaultColor=TGREENLIT,
+                    defaultColor=tools.TGREENLIT,
                 )
             )
         else:
-            print(color_text("  :: No update available", defaultColor=TGREENLIT))
+            print(color_text("  :: No update available", defaultColor=tools.TGREENLIT))
             print(
                 color_text(
                     f'  :: Current version is "{self.__version__}(release)", Most recent version is "{tag}(release)"',
-                    defaultColor=TGREENLIT,
+                    defaultColor=tools.TGREENLIT,
                 )
             )
 
         print("")
 
     def _validate_args(self, args) -> dict:
-        dolFile = Path(args.dolfile).resolve()
-        codeList = Path(args.codelist).resolve()
+        dolFile = Path(os.path.abspath(args.dolfile))
+        codeList = Path(os.path.abspath(args.codelist))
 
         if args.dest:
-            dest = Path(args.dest).resolve()
+            dest = Path(os.path.abspath(args.dest))
             if dest.suffix == "":
                 dest = dest / dolFile.name
         else:
@@ -252,46 +267,51 @@ class GeckoLoaderCli(CommandLineParser):
                 _allocation = int(args.alloc, 16)
             except ValueError:
                 self.error(
-                    color_text("The allocation was invalid\n", defaultColor=TREDLIT)
+                    color_text(
+                        "The allocation was invalid\n", defaultColor=tools.TREDLIT
+                    )
                 )
         else:
             _allocation = None
 
         if args.hookaddress:
-            if 0x80000000 > int(args.hookaddress, 16) >= 0x81800000:
+            try:
+                _codehook = int(args.hookaddress, 16)
+            except ValueError:
                 self.error(
                     color_text(
-                        "The codehandler hook address was beyond bounds\n",
-                        defaultColor=TREDLIT,
+                        "The codehandler hook address was invalid\n",
+                        defaultColor=tools.TREDLIT,
                     )
                 )
-            else:
-                try:
-                    _codehook = int(args.hookaddress, 16)
-                except ValueError:
-                    self.error(
-                        color_text(
-                            "The codehandler hook address was invalid\n",
-                            defaultColor=TREDLIT,
-                        )
+
+            if not 0x80000000 <= _codehook < 0x81800000:
+                self.error(
+                    color_text(
+                        "The codehandler hook address was beyond bounds\n",
+                        defaultColor=tools.TREDLIT,
                     )
+                )
         else:
             _codehook = None
 
         if args.handlerpath:
-            codeHandlerFile = Path(args.handlerpath).resolve()
+            codeHandlerFile = Path(os.path.abspath(args.handlerpath))
         else:
             codeHandlerFile = Path("bin/codehandler.bin")
 
         if not dolFile.is_file():
             self.error(
-                color_text(f'File "{dolFile}" does not exist\n', defaultColor=TREDLIT)
+                color_text(
+                    f'File "{dolFile}" does not exist\n', defaultColor=tools.TREDLIT
+                )
             )
 
         if not codeList.exists():
             self.error(
                 color_text(
-                    f'File/folder "{codeList}" does not exist\n', defaultColor=TREDLIT
+                    f'File/folder "{codeList}" does not exist\n',
+                    defaultColor=tools.TREDLIT,
                 )
             )
 
@@ -313,41 +333,51 @@ class GeckoLoaderCli(CommandLineParser):
         }
 
     def _exec(self, args, tmpdir):
+        from dolreader import DolFile
+        from kernel import CodeHandler, KernelLoader
+
         context = self._validate_args(args)
 
         try:
             with context["dol"].open("rb") as dol:
-                dolFile = DolFile(dol)
-
-            with resource_path(context["codehandler"]).open("rb") as handler:
-                codeHandler = CodeHandler(handler)
-                codeHandler.allocation = context["allocation"]
-                codeHandler.hookAddress = context["hookaddress"]
-                codeHandler.hookType = context["hooktype"]
-                codeHandler.includeAll = context["includeall"]
-                codeHandler.optimizeList = context["optimize"]
-
-            with resource_path("bin/geckoloader.bin").open("rb") as kernelfile:
-                geckoKernel = KernelLoader(kernelfile, cli)
-                geckoKernel.initAddress = context["initaddress"]
-                geckoKernel.verbosity = context["verbosity"]
-                geckoKernel.quiet = context["quiet"]
-                geckoKernel.encrypt = context["encrypt"]
-                geckoKernel.protect = context["protect"]
-
-            if not context["destination"].parent.exists():
-                context["destination"].parent.mkdir(parents=True, exist_ok=True)
+                try:
+                    view = mmap.mmap(dol.fileno(), 0, access=mmap.ACCESS_READ)
+                except (ValueError, OSError):
+                    dolFile = DolFile(dol)  # Empty or unmappable, read it buffered
+                else:
+                    with view:
+                        dolFile = DolFile(view)
+
+            if context["codehandler"].is_absolute():  # User handlers may change
+                codeHandler = CodeHandler(context["codehandler"].read_bytes())
+            else:
+                codeHandler = CodeHandler(load_resource(context["codehandler"]))
+
+            codeHandler.allocation = context["allocation"]
+            codeHandler.hookAddress = context["hookaddress"]
+            codeHandler.hookType = context["hooktype"]
+            codeHandler.includeAll = context["includeall"]
+            codeHandler.optimizeList = context["optimize"]
+
+            geckoKernel = KernelLoader(load_resource("bin/geckoloader.bin"), cli)
+            geckoKernel.initAddress = context["initaddress"]
+            geckoKernel.verbosity = context["verbosity"]
+            geckoKernel.quiet = context["quiet"]
+            geckoKernel.encrypt = context["encrypt"]
+            geckoKernel.protect = context["protect"]
+
+            context["destination"].parent.mkdir(parents=True, exist_ok=True)
 
             geckoKernel.build(
                 context["codepath"],
                 dolFile,
                 codeHandler,
-                TMPDIR,
+                tmpdir,
                 context["destination"],
             )
 
         except FileNotFoundError as e:
-            self.error(color_text(e, defaultColor=TREDLIT))
+            self.error(color_text(e, defaultColor=tools.TREDLIT))
 
 
 class GUI(object):
@@ -377,8 +407,7 @@ class GUI(object):
 
         self.log = logging.getLogger(f"GeckoLoader {self.version}")
 
-        if not get_program_folder("GeckoLoader").exists():
-            get_program_folder("GeckoLoader").mkdir()
+        get_program_folder("GeckoLoader").mkdir(exist_ok=True)
 
         hdlr = logging.FileHandler(get_program_folder("GeckoLoader") / "error.log")
         formatter = logging.Formatter("\n%(levelname)s (%(asctime)s): %(message)s")
@@ -1009,7 +1038,8 @@ class GUI(object):
 
         with redirect_stdout(_outpipe), redirect_stderr(_errpipe):
             try:
-                self.cli._exec(args, tmpdir=TMPDIR)
+                with tempfile.TemporaryDirectory(prefix="GeckoLoader-") as tmpdir:
+                    self.cli._exec(args, tmpdir=Path(tmpdir))
             except (SystemExit, Exception):
                 _status = False
             else:
@@ -1029,8 +1059,7 @@ class GUI(object):
         else:
             datapath = Path(os.getenv("APPDATA")) / "GeckoLoader"
 
-        if not datapath.is_dir():
-            datapath.mkdir()
+        datapath.mkdir(exist_ok=True)
 
         self.app = QtWidgets.QApplication(sys.argv)
         self.default_qtstyle = self.app.style().objectName()
@@ -1075,4 +1104,5 @@ if __name__ == "__main__":
         cli.print_splash()
     else:
         args = cli.parse_args()
-        cli._exec(args, TMPDIR)
+        with tempfile.TemporaryDirectory(prefix="GeckoLoader-") as tmpdir:
+            cli._exec(args, Path(tmpdir))
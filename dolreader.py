@@ -184,8 +184,9 @@ class DolFile(object):
         return self._currLogicAddr
     
     def save(self, f):
-        f.seek(0)
-        f.write(b"\x00" * self.size)
+        """ Builds the DOL image in memory, then writes it to f in a single call """
+
+        image = BytesIO(b"\x00" * self.size)
 
         for i, section in enumerate(self.sections):
             if section["type"] == DolFile.SectionType.Data:
@@ -193,23 +194,26 @@ class DolFile(object):
             else:
                 entry = i
 
-            f.seek(DolFile.offsetInfoLoc + (entry << 2))
-            write_uint32(f, section["offset"]) #offset in file
-            f.seek(DolFile.addressInfoLoc + (entry << 2))
-            write_uint32(f, section["address"]) #game address
-            f.seek(DolFile.sizeInfoLoc + (entry << 2))
-            write_uint32(f, section["size"]) #size in file
+            image.seek(DolFile.offsetInfoLoc + (entry << 2))
+            write_uint32(image, section["offset"]) #offset in file
+            image.seek(DolFile.addressInfoLoc + (entry << 2))
+            write_uint32(image, section["address"]) #game address
+            image.seek(DolFile.sizeInfoLoc + (entry << 2))
+            write_uint32(image, section["size"]) #size in file
 
-            f.seek(section["offset"])
-            f.write(section["data"].getbuffer())
+            image.seek(section["offset"])
+            image.write(section["data"].getbuffer())
 
-        f.seek(DolFile.bssInfoLoc)
-        write_uint32(f, self.bssAddress)
-        write_uint32(f, self.bssSize)
+        image.seek(DolFile.bssInfoLoc)
+        write_uint32(image, self.bssAddress)
+        write_uint32(image, self.bssSize)
 
-        f.seek(DolFile.entryInfoLoc)
-        write_uint32(f, self.entryPoint)
-        align_byte_size(f, 256)
+        image.seek(DolFile.entryInfoLoc)
+        write_uint32(image, self.entryPoint)
+        align_byte_size(image, 256)
+
+        f.seek(0)
+        f.write(image.getbuffer())
 
     @property
     def size(self) -> int:
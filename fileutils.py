@@ -1,3 +1,4 @@
+import functools
 import struct
 import sys
 from os import getenv
@@ -24,6 +25,14 @@ def resource_path(relPath: str = "") -> Path:
         return base_path / relPath
 
 
+@functools.lru_cache(maxsize=4)
+def load_resource(relPath: str = "") -> bytes:
+    """
+    Read a bundled resource once and keep its contents for the life of the process
+    """
+    return resource_path(relPath).read_bytes()
+
+
 def get_program_folder(folder: str = "") -> Path:
     """Get path to appdata"""
     if sys.platform == "win32":
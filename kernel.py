@@ -181,7 +181,11 @@ class CodeHandler(object):
         FULL = "FULL"
 
     def __init__(self, f):
-        self._rawData = BytesIO(f.read())
+        if isinstance(f, (bytes, bytearray, memoryview)):
+            self._rawData = BytesIO(f)
+        else:
+            self._rawData = BytesIO(f.read())
+            f.seek(0)
 
         """Get codelist pointer"""
         self._rawData.seek(0xFA)
@@ -213,8 +217,6 @@ class CodeHandler(object):
         else:
             self.type = CodeHandler.Types.FULL
 
-        f.seek(0)
-
     def init_gct(self, gctFile: Path, tmpdir: Path=None):
         if tmpdir is not None:
             _tmpGct = tmpdir / "gct.bin"
@@ -344,7 +346,10 @@ class CodeHandler(object):
 class KernelLoader(object):
 
     def __init__(self, f, cli: tools.CommandLineParser=None):
-        self._rawData = BytesIO(f.read())
+        if isinstance(f, (bytes, bytearray, memoryview)):
+            self._rawData = BytesIO(f)
+        else:
+            self._rawData = BytesIO(f.read())
         self._initDataList = None
         self._gpModDataList = None
         self._gpDiscDataList = None
@@ -615,41 +620,34 @@ def determine_codehook(dolFile: DolFile, codeHandler: CodeHandler, hook=False) -
 
 
 def assert_code_hook(dolFile: DolFile, codeHandler: CodeHandler) -> bool:
+    hookPatterns = {"VI": (codeHandler.gcnVIHook, codeHandler.wiiVIHook),
+                    "GX": (codeHandler.gcnGXDrawHook, codeHandler.wiiGXDrawHook),
+                    "PAD": (codeHandler.gcnPADHook, codeHandler.wiiPADHook)}
+
+    if codeHandler.hookType not in hookPatterns:
+        raise NotImplementedError(tools.color_text(f"Unsupported hook type specified ({codeHandler.hookType})", defaultColor=tools.TREDLIT))
+
     for section in dolFile.textSections:
         dolFile.seek(section["address"])
         sample = dolFile.read(section["size"])
 
-        if codeHandler.hookType == "VI":
-            result = sample.find(codeHandler.gcnVIHook)
-        elif codeHandler.hookType == "GX":
-            result = sample.find(codeHandler.gcnGXDrawHook)
-        elif codeHandler.hookType == "PAD":
-            result = sample.find(codeHandler.gcnPADHook)
+        for pattern in hookPatterns[codeHandler.hookType]:
+            result = sample.find(pattern)
+            if result >= 0:
+                break
         else:
-            raise NotImplementedError(tools.color_text(f"Unsupported hook type specified ({codeHandler.hookType})", defaultColor=tools.TREDLIT))
+            continue
 
-        if result >= 0:
-            dolFile.seek(section["address"] + result)
-        else:
-            if codeHandler.hookType == "VI":
-                result = sample.find(codeHandler.wiiVIHook)
-            elif codeHandler.hookType == "GX":
-                result = sample.find(codeHandler.wiiGXDrawHook)
-            elif codeHandler.hookType == "PAD":
-                result = sample.find(codeHandler.wiiPADHook)
-            else:
-                raise NotImplementedError(tools.color_text(f"Unsupported hook type specified ({codeHandler.hookType})", defaultColor=tools.TREDLIT))
+        """Find the first blr following the hook, word aligned to the hook"""
 
-            if result >= 0:
-                dolFile.seek(section["address"] + result)
-            else:
-                continue
+        blr = sample.find(b"\x4E\x80\x00\x20", result)
+        while blr >= 0 and (blr - result) & 3:
+            blr = sample.find(b"\x4E\x80\x00\x20", blr + 1)
 
-        while (sample := read_uint32(dolFile)) != 0x4E800020:
-            pass
+        if blr < 0:
+            continue
 
-        dolFile.seek(-4, 1)
-        codeHandler.hookAddress = dolFile.tell()
+        codeHandler.hookAddress = section["address"] + blr
 
         return True
     return False
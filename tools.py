@@ -1,29 +1,46 @@
+import functools
 import struct
 import sys
 import os
 from io import IOBase
 from argparse import ArgumentParser
 
-try:
-    import colorama
-    from colorama import Fore, Style
-    colorama.init()
-    TRESET = Style.RESET_ALL
-    TGREEN = Fore.GREEN
-    TGREENLIT = Style.BRIGHT + Fore.GREEN
-    TYELLOW = Fore.YELLOW
-    TYELLOWLIT = Style.BRIGHT + Fore.YELLOW
-    TRED = Fore.RED
-    TREDLIT = Style.BRIGHT + Fore.RED
-
-except ImportError:
-    TRESET = ""
-    TGREEN = ""
-    TGREENLIT = ""
-    TYELLOW = ""
-    TYELLOWLIT = ""
-    TRED = ""
-    TREDLIT = ""
+_COLORS = ("TRESET", "TGREEN", "TGREENLIT", "TYELLOW", "TYELLOWLIT", "TRED", "TREDLIT")
+
+def _init_color():
+    """ Import colorama on first use and set up the T* color constants """
+
+    global TRESET, TGREEN, TGREENLIT, TYELLOW, TYELLOWLIT, TRED, TREDLIT
+
+    if "TRESET" in globals():
+        return
+
+    try:
+        import colorama
+        from colorama import Fore, Style
+        colorama.init()
+        TRESET = Style.RESET_ALL
+        TGREEN = Fore.GREEN
+        TGREENLIT = Style.BRIGHT + Fore.GREEN
+        TYELLOW = Fore.YELLOW
+        TYELLOWLIT = Style.BRIGHT + Fore.YELLOW
+        TRED = Fore.RED
+        TREDLIT = Style.BRIGHT + Fore.RED
+
+    except ImportError:
+        TRESET = ""
+        TGREEN = ""
+        TGREENLIT = ""
+        TYELLOW = ""
+        TYELLOWLIT = ""
+        TRED = ""
+        TREDLIT = ""
+
+def __getattr__(name: str):
+    if name in _COLORS:
+        _init_color()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 def get_alignment(number: int, align: int) -> int:
     if number % align != 0:
@@ -54,44 +71,27 @@ def align_byte_size(obj, alignment: int, fillchar="00"):
     else:
         raise NotImplementedError(f"Aligning the size of class {type(obj)} is unsupported")
 
-def color_text(text: str, textToColor: list=[("", None)], defaultColor: str=None) -> str:
-    currentColor = None
-    formattedText = ""
+@functools.lru_cache(maxsize=16)
+def _compile_colors(textToColor: tuple, defaultColor: str) -> tuple:
+    baseColor = defaultColor or ""
+    colors = {}
 
-    format = False
-    for itemPair in textToColor:
-        if itemPair[0] != "" and itemPair[1] is not None:
-            format = True
+    for chars, color in textToColor:
+        if chars == "" or color is None:
+            continue
+        if r"\*" in chars:
+            baseColor = color
             break
+        for char in chars:
+            colors.setdefault(ord(char), color)
 
-    if not format:
-        return defaultColor + text + TRESET
-
-    for char in text:
-        handled = False
-        for itemPair in textToColor:
-            if (char in itemPair[0] or r"\*" in itemPair[0]) and itemPair[1] is not None:
-                if currentColor != itemPair[1]:
-                    formattedText += TRESET
-                    formattedText += itemPair[1]
-                    currentColor = itemPair[1]
-                handled = True
-
-            elif defaultColor is not None:
-                formattedText += TRESET
-                formattedText += defaultColor
-                currentColor = defaultColor
+    return baseColor, {code: TRESET + color + chr(code) + TRESET + baseColor for code, color in colors.items()}
 
-            elif currentColor is not None:
-                formattedText += TRESET
-                currentColor = None
-
-            if handled:
-                break
-
-        formattedText += char
+def color_text(text: str, textToColor: list=[("", None)], defaultColor: str=None) -> str:
+    _init_color()
 
-    return formattedText + TRESET
+    baseColor, table = _compile_colors(tuple(tuple(itemPair) for itemPair in textToColor), defaultColor)
+    return baseColor + text.translate(table) + TRESET
 
 class CommandLineParser(ArgumentParser):
     